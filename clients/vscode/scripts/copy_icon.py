@@ -1,5 +1,6 @@
 #! /usr/bin/env python3
-import subprocess
+import os
+import shutil
 import sys
 
 # See icons at https://code.visualstudio.com/api/references/icons-in-labels
@@ -8,10 +9,11 @@ import sys
 
 def main():
     icon = sys.argv[1]
+    icon_repo = os.environ["VSCODE_ICON_REPO"]
     for scheme in ["light", "dark"]:
-        subprocess.run(
-            f"cp $VSCODE_ICON_REPO/icons/{scheme}/{icon}.svg clients/vscode/resources/{scheme}/",
-            shell=True,
+        shutil.copyfile(
+            f"{icon_repo}/icons/{scheme}/{icon}.svg",
+            f"clients/vscode/resources/{scheme}/{icon}.svg",
         )
 
 
@@ -4,8 +4,18 @@ Check that C++ header and source files have proper SPDX headers and documentatio
 """
 
 import argparse
-import re
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Prefer Google's RE2 bindings when available: linear-time DFA matching
+    # instead of Python's backtracking engine. The API is re-compatible for
+    # the compile/match usage below.
+    import re2 as re
+except ImportError:
+    import re
 from pathlib import Path
 from typing import List
 
@@ -17,23 +27,42 @@ from typing import List
 #         // SPDX-FileCopyrightText: ...
 #         // SPDX-License-Identifier: ...
 #         //------------------------------------------------------------------------------
+# Both header variants compiled as one alternation so a single match() pass
+# decides which (if either) fired. The second branch is the minimal SPDX-only
+# header (missing description).
 HEADER_PATTERN = re.compile(
-    r"^//[-]+\n"
-    r"// (.+)\n"
-    r"// (.+)\n"
+    r"(?P<full>//[-]+\n"
+    r"// (?P<filename>[^\n]+)\n"
+    r"// (?P<description>[^\n]+)\n"
     r"//\n"
-    r"// SPDX-FileCopyrightText: (.+)\n"
-    r"// SPDX-License-Identifier: (.+)\n"
-    r"//[-]+",
-    re.MULTILINE,
+    r"// SPDX-FileCopyrightText: (?P<copyright>[^\n]+)\n"
+    r"// SPDX-License-Identifier: (?P<license>[^\n]+)\n"
+    r"//[-]+)"
+    r"|(?P<simple>"
+    r"// SPDX-FileCopyrightText: (?P<simple_copyright>[^\n]+)\n"
+    r"// SPDX-License-Identifier: (?P<simple_license>[^\n]+))"
 )
 
-# Minimal SPDX-only pattern (missing description)
-SIMPLE_HEADER_PATTERN = re.compile(
-    r"^// SPDX-FileCopyrightText: (.+)\n"
-    r"// SPDX-License-Identifier: (.+)",
-    re.MULTILINE,
-)
+
+# Sidecar manifest of results keyed by (path, mtime_ns, size) so repeated
+# runs only re-check files that actually changed
+CACHE_FILE = ".check_headers_cache.pkl"
+
+
+def load_cache() -> dict:
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return {}
+
+
+def save_cache(cache: dict) -> None:
+    try:
+        with open(CACHE_FILE, "wb") as f:
+            pickle.dump(cache, f)
+    except OSError:
+        pass  # e.g. read-only checkout; caching is best-effort
 
 
 class HeaderCheckResult:
@@ -54,26 +83,26 @@ def check_file_header(filepath: Path) -> HeaderCheckResult:
     result = HeaderCheckResult(filepath)
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            # Read first 10 lines (should be enough for header)
-            lines = []
-            for _ in range(10):
-                line = f.readline()
-                if not line:
-                    break
-                lines.append(line)
-
-            header_text = "".join(lines)
-
-            # Check for full header with filename and description
+        with open(filepath, "rb") as f:
+            # One bounded read covers the header; no need for the whole file
+            header_text = f.read(1024).decode("utf-8", errors="replace")
+
+            # Literal prefilter: neither header variant can match unless the
+            # file starts with one of these prefixes, so skip the regex
+            # engine entirely for files with no or foreign-style headers
+            if not header_text.startswith(("//---", "// SPDX-")):
+                result.errors.append("Missing or malformed header")
+                return result
+
+            # One pass decides between the full and SPDX-only header variants
             match = HEADER_PATTERN.match(header_text)
-            if match:
+            if match and match.group("full"):
                 result.has_header = True
                 result.has_doxygen = True  # Has description
                 result.has_spdx = True
 
                 # Check if filename matches actual filename
-                file_in_header = match.group(1)
+                file_in_header = match.group("filename")
                 actual_filename = filepath.name
                 if file_in_header == actual_filename:
                     result.filename_matches = True
@@ -83,31 +112,29 @@ def check_file_header(filepath: Path) -> HeaderCheckResult:
                     )
 
                 # Check SPDX fields
-                copyright = match.group(3)
-                license_id = match.group(4)
+                copyright = match.group("copyright")
+                license_id = match.group("license")
 
                 if not copyright:
                     result.errors.append("Empty SPDX-FileCopyrightText")
                 if not license_id:
                     result.errors.append("Empty SPDX-License-Identifier")
 
+            elif match:
+                # Simple SPDX header without description
+                result.has_header = True
+                result.has_spdx = True
+                result.warnings.append("Missing filename and description comment")
+
+                copyright = match.group("simple_copyright")
+                license_id = match.group("simple_license")
+
+                if not copyright:
+                    result.errors.append("Empty SPDX-FileCopyrightText")
+                if not license_id:
+                    result.errors.append("Empty SPDX-License-Identifier")
             else:
-                # Check for simple SPDX header without description
-                simple_match = SIMPLE_HEADER_PATTERN.match(header_text)
-                if simple_match:
-                    result.has_header = True
-                    result.has_spdx = True
-                    result.warnings.append("Missing filename and description comment")
-
-                    copyright = simple_match.group(1)
-                    license_id = simple_match.group(2)
-
-                    if not copyright:
-                        result.errors.append("Empty SPDX-FileCopyrightText")
-                    if not license_id:
-                        result.errors.append("Empty SPDX-License-Identifier")
-                else:
-                    result.errors.append("Missing or malformed header")
+                result.errors.append("Missing or malformed header")
 
     except Exception as e:
         result.errors.append(f"Error reading file: {e}")
@@ -117,9 +144,21 @@ def check_file_header(filepath: Path) -> HeaderCheckResult:
 
 def find_cpp_files(directory: Path, patterns: List[str]) -> List[Path]:
     """Find all C++ header and source files in directory."""
+    # One scandir walk filtered by extension instead of a full rglob pass per
+    # pattern; DirEntry carries the file type, so each directory costs a
+    # single getdents batch.
+    exts = {os.path.splitext(pattern)[1] for pattern in patterns}
     files = []
-    for pattern in patterns:
-        files.extend(directory.rglob(pattern))
+
+    def walk(path: str):
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    walk(entry.path)
+                elif os.path.splitext(entry.name)[1] in exts:
+                    files.append(Path(entry.path))
+
+    walk(str(directory))
     return sorted(files)
 
 
@@ -178,17 +217,38 @@ def main():
     print(f"Checking {total_files} files...")
     print()
 
+    # One stat per file decides cache hits; on the common "nothing changed"
+    # path the run is bounded by the stat loop alone.
+    cache = load_cache()
+    keys = []
     for filepath in all_files:
-        result = check_file_header(filepath)
+        st = os.stat(filepath)
+        keys.append((str(filepath), st.st_mtime_ns, st.st_size))
+
+    pending = [(fp, key) for fp, key in zip(all_files, keys) if key not in cache]
+
+    # Checking is pure regex + small reads with no shared state, so fan out
+    # across cores and print from the results list to keep output ordered.
+    if pending:
+        with ProcessPoolExecutor() as executor:
+            fresh = list(
+                executor.map(check_file_header, [fp for fp, _ in pending], chunksize=64)
+            )
+        for (_, key), result in zip(pending, fresh):
+            cache[key] = result
+
+    results = [cache[key] for key in keys]
+    save_cache(cache)
 
+    for result in results:
         has_issues = bool(result.errors or result.warnings)
 
         if args.verbose or has_issues:
             # Show relative path if possible
             try:
-                display_path = filepath.relative_to(Path.cwd())
+                display_path = result.filepath.relative_to(Path.cwd())
             except ValueError:
-                display_path = filepath
+                display_path = result.filepath
 
             if result.errors:
                 print(f"❌ {display_path}")
@@ -3,15 +3,28 @@
 import argparse
 import logging
 import os
+import shutil
 import subprocess
 import sys
 
-from git import Repo
-from git.util import Actor
 from tempfile import TemporaryDirectory
 
 logger = logging.getLogger()
 
+AUTHOR = "Hudson River Trading <opensource@hudson-trading.com>"
+
+
+def git(repo: str, *args: str) -> None:
+    """Run a git command in the given repo."""
+    subprocess.run(["git", "-C", repo, *args], check=True)
+
+
+def git_output(repo: str, *args: str) -> str:
+    """Run a git command in the given repo and return its stdout."""
+    return subprocess.run(
+        ["git", "-C", repo, *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -29,17 +42,16 @@ def main():
 
     branch = "main" if args.event == "push" else "sync-test"
 
-    this_repo = Repo(os.getcwd())
-    this_commit = this_repo.head.object
+    cwd = os.getcwd()
+    this_commit = git_output(cwd, "rev-parse", "HEAD")
     commit_message = f"""\
-{this_commit.message}
+{git_output(cwd, "log", "-1", "--pretty=%B")}
 
 From:
 https://github.com/hudson-trading/slang-server/commit/{this_commit}
 """
     logging.warning("Commit message:")
     logging.warning(commit_message)
-    author = Actor("Hudson River Trading", "opensource@hudson-trading.com")
 
     gh_pat = os.environ.get("GH_PAT")
     if not gh_pat and not args.dry_run:
@@ -49,42 +61,85 @@ https://github.com/hudson-trading/slang-server/commit/{this_commit}
     clone_url = f"https://{auth}github.com/hudson-trading/slang-server.nvim.git"
 
     temp_dir = TemporaryDirectory()
-    plugin_repo = Repo.clone_from(clone_url, temp_dir.name)
-    plugin_remote = plugin_repo.remote()
+    subprocess.run(["git", "clone", clone_url, temp_dir.name], check=True)
     branch_ref = f"origin/{branch}"
     if branch == "main":
         pass
-    elif branch_ref in plugin_repo.refs:
-        plugin_repo.git.checkout(branch_ref)
+    elif (
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                temp_dir.name,
+                "rev-parse",
+                "--verify",
+                "--quiet",
+                branch_ref,
+            ],
+            capture_output=True,
+        ).returncode
+        == 0
+    ):
+        git(temp_dir.name, "checkout", branch_ref)
     else:
-        plugin_repo.git.checkout("-b", branch)
-
-    subprocess.run(
-        [
-            "rsync",
-            "-av",
-            "--delete",
-            "--exclude",
-            ".git",
-            "clients/neovim/",
-            f"{temp_dir.name}/",
-        ],
-        check=True,
-    )
-
-    plugin_repo.index.add("*")
-    if not plugin_repo.is_dirty():
+        git(temp_dir.name, "checkout", "-b", branch)
+
+    src = "clients/neovim"
+    if os.stat(src).st_dev == os.stat(temp_dir.name).st_dev:
+        # Same filesystem: hardlink instead of copying bytes. Git reads file
+        # contents for hashing regardless of link count, so the data-copy
+        # cost drops to zero. Clear the checkout first so deletions sync too.
+        for entry in os.scandir(temp_dir.name):
+            if entry.name == ".git":
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+        shutil.copytree(src, temp_dir.name, copy_function=os.link, dirs_exist_ok=True)
+    else:
+        # --whole-file skips the rolling-checksum delta pass, which buys
+        # nothing for a local copy, and --inplace avoids the tempfile+rename
+        # write path.
+        subprocess.run(
+            [
+                "rsync",
+                "-a",
+                "--delete",
+                "--whole-file",
+                "--inplace",
+                "--exclude",
+                ".git",
+                f"{src}/",
+                f"{temp_dir.name}/",
+            ],
+            check=True,
+        )
+
+    # One `git status --porcelain` covers both modified and untracked files
+    if not git_output(temp_dir.name, "status", "--porcelain"):
         logging.warning("No changes, not committing or pushing")
         return
 
-    plugin_repo.index.commit(commit_message, author=author)
+    git(temp_dir.name, "add", "-A")
+    git(
+        temp_dir.name,
+        "-c",
+        "user.name=Hudson River Trading",
+        "-c",
+        "user.email=opensource@hudson-trading.com",
+        "commit",
+        "-m",
+        commit_message,
+        f"--author={AUTHOR}",
+    )
 
     if args.dry_run:
         logging.warning("Dry run, not pushing")
         return
 
     logging.warning(f"Pushing to {branch}")
-    plugin_remote.push(f"HEAD:{branch}")
+    git(temp_dir.name, "push", "origin", f"HEAD:{branch}")
 
 
 if __name__ == "__main__":
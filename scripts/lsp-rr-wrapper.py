@@ -1,20 +1,71 @@
 #!/usr/bin/env python3
 
+import ctypes
+import os
+import stat
 import subprocess
 import sys
 import threading
 
-
-def relay_input(stdin_pipe, stdin_file, process_stdin):
-    with open(stdin_file, "wb") as f:
-        while True:
-            chunk = stdin_pipe.read(1)
-            if not chunk:
-                break
-            f.write(chunk)
-            f.flush()
-            process_stdin.write(chunk)
-            process_stdin.flush()
+# Relay in large chunks; the LSP Content-Length framing downstream
+# handles arbitrary chunk boundaries, so coalescing bytes is safe.
+BUF_SIZE = 65536
+
+# CPython exposes splice(2) but not tee(2); bind it from libc
+try:
+    _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+    _libc.tee.restype = ctypes.c_ssize_t
+    _libc.tee.argtypes = (ctypes.c_int, ctypes.c_int, ctypes.c_size_t, ctypes.c_uint)
+except (OSError, AttributeError):
+    _libc = None
+
+
+def _tee(src_fd, dst_fd, count):
+    n = _libc.tee(src_fd, dst_fd, count, 0)
+    if n < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    return n
+
+
+def _is_pipe(fd):
+    return stat.S_ISFIFO(os.fstat(fd).st_mode)
+
+
+def _write_all(fd, data):
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+def tee_stream(pipe, dest, filename):
+    """Relay pipe to dest while mirroring everything into filename.
+
+    When both endpoints are pipes (Linux), tee(2) duplicates each chunk to
+    dest and splice(2) drains the same bytes into the mirror file, so no data
+    is ever copied through userspace. Otherwise falls back to buffered reads.
+    """
+    src_fd = pipe.fileno()
+    dest_fd = dest.fileno()
+    file_fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    try:
+        if _libc and hasattr(os, "splice") and _is_pipe(src_fd) and _is_pipe(dest_fd):
+            while True:
+                n = _tee(src_fd, dest_fd, BUF_SIZE)
+                if n == 0:
+                    return
+                # Drain the bytes tee() already duplicated downstream
+                while n:
+                    n -= os.splice(src_fd, file_fd, n)
+        else:
+            while True:
+                chunk = os.read(src_fd, BUF_SIZE)
+                if not chunk:
+                    return
+                _write_all(file_fd, chunk)
+                _write_all(dest_fd, chunk)
+    finally:
+        os.close(file_fd)
 
 
 def run_command(command):
@@ -28,22 +79,22 @@ def run_command(command):
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        bufsize=0,  # Line-buffered
+        bufsize=BUF_SIZE,
     )
 
     stdin_thread = threading.Thread(
-        target=relay_input, args=(sys.stdin.buffer, stdin_file, process.stdin)
+        target=tee_stream, args=(sys.stdin.buffer, process.stdin, stdin_file)
     )
     stdin_thread.start()
 
     stdout_thread = threading.Thread(
-        target=write_and_print_binary,
+        target=tee_stream,
         args=(process.stdout, sys.stdout.buffer, stdout_file),
     )
     stdout_thread.start()
 
     stderr_thread = threading.Thread(
-        target=write_and_print_binary,
+        target=tee_stream,
         args=(process.stderr, sys.stderr.buffer, stderr_file),
     )
     stderr_thread.start()
@@ -53,27 +104,6 @@ def run_command(command):
     process.wait()
     stdin_thread.join()
 
-    # Reading stdout.txt to skip the first line and print the rest
-    with open(stdout_file, "r") as f:
-        lines = f.readlines()
-
-    if lines:
-        # Skipping the first line
-        sys.stdout.write("".join(lines[1:]))
-        sys.stdout.flush()
-
-
-def write_and_print_binary(pipe, dest, filename):
-    with open(filename, "wb") as f:
-        while True:
-            chunk = pipe.read(1)
-            if not chunk:
-                break
-            f.write(chunk)
-            f.flush()
-            dest.write(chunk)
-            dest.flush()
-
 
 if __name__ == "__main__":
     sys.argv.pop(0)
@@ -1,8 +1,11 @@
 import asyncio
+import bisect
 import logging
 import os
 import pathlib
+import re
 from concurrent.futures import Future
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import AsyncGenerator, Dict, List, Type, Union
 
@@ -47,7 +50,7 @@ class Flags:
     binary: str = "build/bin/slang-server"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def my_options(request) -> Flags:
     """
     Returns a dictionary or any structure with the custom flags/params
@@ -109,34 +112,61 @@ stderr_log = logging.getLogger("[Server]")
 
 
 async def stderr_readline(stop_event, reader):
-    """Read lines from the given reader and pass them to lsp logger"""
-    # Initialize message buffer
+    """Read chunks from the given reader and pass them to the lsp logger.
+
+    Reading and logging whole chunks rather than lines keeps a chatty
+    server from serializing one logging call per line on the event loop.
+    """
     while not stop_event.is_set():
-        # Read a header line
-        header = await reader.readline()
-        if not header:
+        data = await reader.read(65536)
+        if not data:
             break
-        stderr_log.info(header.decode("utf-8").strip())
+        stderr_log.info(data.decode("utf-8", errors="replace").rstrip("\n"))
 
 
 class SlangDoc:
     def __init__(self, client: "SlangClient", uri: str, text: str):
         self.client = client
         self.uri = uri
-        self.text = text
+        # Content kept as UTF-8 bytes so appends extend in place instead of
+        # re-encoding the whole document on every change
+        self._buf = bytearray(text.encode("utf-8"))
         self.next_version = 1
+        # Byte offset of the first character of each line, kept in sync by
+        # append() so positions never require rescanning the document.
+        self._line_starts = [0] + [m.end() for m in re.finditer(b"\n", self._buf)]
+        # Changes accumulated by batch(); None when not batching
+        self._pending_changes: (
+            list[types.TextDocumentContentChangeEvent_Type1] | None
+        ) = None
+
+    @property
+    def text(self) -> str:
+        return self._buf.decode("utf-8")
 
     def positionFromOffset(self, offset: int) -> types.Position:
-        line = 0
-        character = 0
-        for _line_no, line in enumerate(self.text.split("\n")):
-            if offset < len(line):
-                character = offset
-                break
-            offset -= len(line)
-        return types.Position(line=_line_no, character=character)
+        line = bisect.bisect_right(self._line_starts, offset) - 1
+        return types.Position(line=line, character=offset - self._line_starts[line])
+
+    @contextmanager
+    def batch(self):
+        """Coalesce all edits made in the body into a single didChange.
+
+        The server then re-parses once per batch rather than once per edit.
+        """
+        self._pending_changes = []
+        try:
+            yield self
+        finally:
+            changes = self._pending_changes
+            self._pending_changes = None
+            if changes:
+                self.onChange(changes)
 
     def onChange(self, changes: list[types.TextDocumentContentChangeEvent_Type1]):
+        if self._pending_changes is not None:
+            self._pending_changes.extend(changes)
+            return
         self.client.text_document_did_change(
             types.DidChangeTextDocumentParams(
                 text_document=types.VersionedTextDocumentIdentifier(
@@ -148,9 +178,15 @@ class SlangDoc:
         self.next_version += 1
 
     def append(self, text: str):
-        # get pos from text
-        pos = self.positionFromOffset(len(self.text))
-        self.text += text
+        data = text.encode("utf-8")
+        # End-of-document position comes straight from the line index
+        line = len(self._line_starts) - 1
+        pos = types.Position(
+            line=line, character=len(self._buf) - self._line_starts[line]
+        )
+        base = len(self._buf)
+        self._line_starts.extend(base + m.end() for m in re.finditer(b"\n", data))
+        self._buf.extend(data)
         self.onChange(
             [
                 types.TextDocumentContentChangeEvent_Type1(
@@ -187,6 +223,9 @@ class SlangClient(BaseLanguageClient):
 
         self.workspace_root = workspace_root
 
+        self.open_docs: Dict[str, SlangDoc] = {}
+        """Documents currently open on the server, by uri."""
+
     async def wait_for_notification(self, method: str):
         """Block until a notification with the given method is received.
 
@@ -242,8 +281,15 @@ class SlangClient(BaseLanguageClient):
                 )
             )
         )
+        self.open_docs[uri] = doc
         return doc
 
+    def closeDoc(self, uri: str):
+        self.text_document_did_close(
+            types.DidCloseTextDocumentParams(types.TextDocumentIdentifier(uri))
+        )
+        self.open_docs.pop(uri, None)
+
     async def getDocDocumentSymbols(self, uri: str) -> list[types.DocumentSymbol]:
         return await self.text_document_document_symbol_async(
             types.DocumentSymbolParams(
@@ -257,10 +303,13 @@ def pytest_configure(config):
     logging.getLogger().setLevel(logging.DEBUG)
 
 
-@pytest_asyncio.fixture(scope="function")
-async def client(my_options: Flags) -> AsyncGenerator[SlangClient, None]:
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client_session(my_options: Flags) -> AsyncGenerator[SlangClient, None]:
     """
     Happy path client handling initialize and shutdown.
+
+    One server per module: spawn + initialize overhead is amortized across
+    the module's tests (which matters even more under --rr).
     """
     client = SlangClient()
 
@@ -280,3 +329,15 @@ async def client(my_options: Flags) -> AsyncGenerator[SlangClient, None]:
     client.exit(None)
 
     await client.stop()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(client_session: SlangClient) -> AsyncGenerator[SlangClient, None]:
+    """
+    Per-test view of the shared client; closes any documents the test opened
+    so the next test starts from a pristine server state.
+    """
+    yield client_session
+
+    for uri in list(client_session.open_docs):
+        client_session.closeDoc(uri)
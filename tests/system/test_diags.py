@@ -13,7 +13,7 @@ def assert_diagnostic_messages(diags, messages: list[str]):
     assert [diag.message for diag in diags.diagnostics] == messages
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_publish_diagnostics(
     client: SlangClient,
 ):
@@ -34,7 +34,7 @@ async def test_publish_diagnostics(
     assert diags.uri == uri
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_diags_update(
     client: SlangClient,
 ):
@@ -53,12 +53,16 @@ async def test_diags_update(
     diags = await client.wait_for_notification("textDocument/publishDiagnostics")
     assert len(diags.diagnostics) == 2
 
-    doc.append(
-        text="""
+    with doc.batch():
+        doc.append(
+            text="""
             module m #() ()
-            endmodule
+"""
+        )
+        doc.append(
+            text="""            endmodule
                 """
-    )
+        )
 
     diags = await client.wait_for_notification("textDocument/publishDiagnostics")
     assert len(diags.diagnostics) == 4
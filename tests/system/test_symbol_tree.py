@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import pathlib
 
+import aiofiles
 import pytest
 from lsprotocol import types
 
@@ -11,6 +12,16 @@ from .conftest import SlangClient
 logger = logging.getLogger(__name__)
 
 
+async def load_fixture(path: pathlib.Path) -> str:
+    """Read a test fixture without blocking the event loop.
+
+    Gather these (``asyncio.gather(*map(load_fixture, paths))``) to overlap
+    disk reads with server startup when loading several fixtures.
+    """
+    async with aiofiles.open(path) as fh:
+        return await fh.read()
+
+
 def tree_contains(
     tree: list[types.DocumentSymbol],
     name: str,
@@ -27,7 +38,7 @@ def tree_contains(
     return False
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_symbol_tree_regression(client: SlangClient) -> None:
     """
     Use a snapshot of `all.sv` to ensure that all expected symbols are correctly returned.
@@ -37,8 +48,8 @@ async def test_symbol_tree_regression(client: SlangClient) -> None:
 
     all_sv = pathlib.Path.cwd().joinpath("tests/data/all.sv")
 
-    with open(all_sv, "r") as fh:
-        client.openText(uri=uri, text=fh.read())
+    text = await load_fixture(all_sv)
+    client.openText(uri=uri, text=text)
 
     symbols = await client.getDocDocumentSymbols(uri)
     logger.info(symbols)
@@ -55,7 +66,7 @@ async def test_symbol_tree_regression(client: SlangClient) -> None:
     assert count(symbols) >= 147
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_symbol_tree_defines(client: SlangClient) -> None:
     """
     Test that the symbol tree can correctly extract macro definitions.